@@ -1,10 +1,18 @@
 """Module defines data types and helper function for recognizing them."""
 
+from __future__ import annotations
+
+import functools
+import sys
 from enum import IntEnum
-from typing import Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
-import numpy as np
-import pandas as pd
+# numpy and pandas are imported inside the functions which need them, so that
+# importing only `DataType` does not pay their import cost; once imported,
+# the repeated function-level imports are plain `sys.modules` lookups.
+# pylint: disable=import-outside-toplevel
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class DataType(IntEnum):
@@ -18,7 +26,15 @@ class DataType(IntEnum):
     MISSING = 6
 
     def __str__(self):
-        return self.name.lower()
+        return _DATATYPE_STR[self]
+
+
+# Interned string forms of the data types, so that repeated string
+# representation lookups share one string object per data type instead of
+# allocating a new lowercase string on every call.
+_DATATYPE_STR: Dict[DataType, str] = {
+    data_type: sys.intern(data_type.name.lower()) for data_type in DataType
+}
 
 
 def infer_data_type(series: pd.Series, string_representation: bool = False) -> Union[DataType, str]:
@@ -37,20 +53,104 @@ def infer_data_type(series: pd.Series, string_representation: bool = False) -> U
         Inferred custom edvart data type or its string representation.
     """
     ret = None
-    if is_missing(series):
+    dtype = series.dtype
+    # Fast path: for columns with a specific dtype, the data type can be determined
+    # from the dtype alone in O(1), without scanning the values
+    # (apart from checking for all-missing series).
+    dtype_inferred = _infer_by_dtype(dtype)
+    if dtype_inferred is not None:
+        ret = DataType.MISSING if is_missing(series) else dtype_inferred
+    elif dtype.kind in "iufc":
+        # A numeric dtype rules out dates, so `is_date` — by far the most expensive
+        # check since it attempts to parse values out of strings — is skipped.
+        if is_missing(series):
+            ret = DataType.MISSING
+        elif _is_boolean(series):
+            ret = DataType.BOOLEAN
+        elif _is_categorical(series):
+            ret = DataType.CATEGORICAL
+        else:
+            ret = DataType.NUMERIC
+    # Object and extension dtypes fall through to the full cascade of checks.
+    # The private predicates assume a series which is not all-missing,
+    # so the missing check runs exactly once per call.
+    elif is_missing(series):
         ret = DataType.MISSING
-    if is_boolean(series):
+    elif _is_boolean(series):
         ret = DataType.BOOLEAN
-    elif is_date(series):
+    elif _is_date(series):
         ret = DataType.DATE
-    elif is_categorical(series):
+    elif _is_categorical(series):
         ret = DataType.CATEGORICAL
-    elif is_numeric(series):
+    elif _is_numeric(series):
         ret = DataType.NUMERIC
     else:
         ret = DataType.UNKNOWN
 
-    return str(ret) if string_representation else ret
+    return _DATATYPE_STR[ret] if string_representation else ret
+
+
+def infer_data_types(
+    df: pd.DataFrame, string_representation: bool = False
+) -> Dict[Any, Union[DataType, str]]:
+    """Infers the data type of each column of the DataFrame.
+
+    Columns whose dtype alone determines the data type are resolved without
+    scanning their values and the all-missing check is vectorized across all
+    columns at once, so inferring a whole frame is cheaper than calling
+    `infer_data_type` on each column separately.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame from which to infer data types.
+    string_representation : bool
+        Whether to return the resulting data types as DataType enum values or strings.
+
+    Returns
+    -------
+    Dict[Any, Union[DataType, str]]
+        Mapping of column name to the inferred data type or its string representation.
+        If the frame contains duplicate column labels, the mapping holds the type
+        of the last column with each label.
+    """
+    na_all = df.isna().all()
+    result = {}
+    # Columns are accessed by position — label-based lookups return a whole
+    # sub-frame when the frame has duplicate column labels.
+    for i, (column, dtype) in enumerate(zip(df.columns, df.dtypes)):
+        if na_all.iloc[i]:
+            data_type = DataType.MISSING
+        else:
+            data_type = _infer_by_dtype(dtype)
+            if data_type is None:
+                data_type = infer_data_type(df.iloc[:, i])
+        result[column] = _DATATYPE_STR[data_type] if string_representation else data_type
+
+    return result
+
+
+@functools.lru_cache(maxsize=64)
+def _infer_by_dtype(dtype: Any) -> Optional[DataType]:
+    """Infers the data type from the dtype alone, when the dtype determines it.
+
+    Returns None for dtypes whose data type depends on the values (numeric
+    dtypes may turn out boolean or categorical, and object dtypes require the
+    full cascade of checks). Since only the dtype is examined, the caller is
+    responsible for resolving all-missing series to `DataType.MISSING`.
+
+    Results are memoized — wide DataFrames typically share a handful of dtypes
+    across all of their columns.
+    """
+    import pandas as pd
+
+    if isinstance(dtype, (pd.DatetimeTZDtype, pd.PeriodDtype)) or dtype.kind in "Mm":
+        return DataType.DATE
+    if isinstance(dtype, pd.CategoricalDtype):
+        return DataType.CATEGORICAL
+    if dtype.kind == "b":
+        return DataType.BOOLEAN
+    return None
 
 
 def is_numeric(series: pd.Series) -> bool:
@@ -67,15 +167,15 @@ def is_numeric(series: pd.Series) -> bool:
     bool
         Boolean indicating whether series contains only numbers.
     """
-    if is_missing(series):
-        return False
-    # When an unkown dtype is encountered, `np.issubdtype(series.dtype, np.number)`
-    # raises a TypeError. This happens for example if `series` is `pd.Categorical`
-    # If the dtype is unknown, we treat it as non-numeric, therefore return False.
-    try:
-        return np.issubdtype(series.dtype, np.number)
-    except TypeError:
-        return False
+    return not is_missing(series) and _is_numeric(series)
+
+
+def _is_numeric(series: pd.Series) -> bool:
+    """Implementation of `is_numeric`; assumes the series is not all-missing."""
+    # A single-character kind comparison replaces `np.issubdtype`, which raises
+    # a TypeError on extension dtypes such as `pd.Categorical`; every dtype,
+    # including extension dtypes, exposes `kind`.
+    return series.dtype.kind in "iufc"
 
 
 def is_missing(series: pd.Series) -> bool:
@@ -91,7 +191,11 @@ def is_missing(series: pd.Series) -> bool:
     bool
         True if all values in the series are missing, False otherwise.
     """
-    return series.isnull().all()
+    import numpy as np
+
+    # `np.asarray` exposes the raw boolean mask, so the reduction runs as
+    # a single C-level pass instead of going through pandas' dispatch.
+    return not np.asarray(series.notna()).any()
 
 
 def is_categorical(series: pd.Series, unique_value_count_threshold: int = 10) -> bool:
@@ -112,18 +216,65 @@ def is_categorical(series: pd.Series, unique_value_count_threshold: int = 10) ->
     """
     return (
         not is_missing(series)
-        and not is_boolean(series)
-        and not is_date(series)
-        and (
-            (
-                series.nunique() <= unique_value_count_threshold
-                and pd.api.types.is_integer_dtype(series)
-            )
-            or pd.api.types.is_string_dtype(series)
-        )
+        and not _is_boolean(series)
+        and not _is_date(series)
+        and _is_categorical(series, unique_value_count_threshold)
+    )
+
+
+def _is_categorical(series: pd.Series, unique_value_count_threshold: int = 10) -> bool:
+    """Implementation of `is_categorical`; assumes the series is not all-missing,
+    boolean or date."""
+    import pandas as pd
+
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return True
+    return (dtype.kind in "iu" and _nunique_at_most(series, unique_value_count_threshold)) or (
+        # String-like columns: object or string kinds, except the extension
+        # dtypes whose storage kind is "O" but which do not hold strings.
+        dtype.kind in "OSU"
+        and not isinstance(dtype, (pd.PeriodDtype, pd.IntervalDtype))
     )
 
 
+def _nunique_at_most(series: pd.Series, max_count: int, chunk_size: int = 1024) -> bool:
+    """Tells whether the series has at most `max_count` unique values.
+
+    Unlike `pd.Series.nunique`, which always hashes the entire series,
+    this deduplicates the values in chunks and stops scanning as soon as
+    more than `max_count` distinct values have been seen. Missing values
+    are not counted, matching `nunique`'s default of dropping them.
+
+    Parameters
+    ----------
+    series : pd.Series
+        Series in which to count unique values.
+    max_count : int
+        Maximum number of unique values to tolerate.
+    chunk_size : int
+        Number of values deduplicated per batch.
+
+    Returns
+    -------
+    bool
+        True if the series has at most `max_count` unique values.
+    """
+    import pandas as pd
+
+    arr = series.to_numpy()
+    seen = set()
+    for start in range(0, len(arr), chunk_size):
+        values = pd.unique(arr[start : start + chunk_size])
+        # Missing values (e.g. `pd.NA` in nullable integer columns) must not
+        # be tallied as distinct values; masking the handful of uniques per
+        # chunk is cheaper than dropping NAs from the whole series up front.
+        seen.update(values[pd.notna(values)])
+        if len(seen) > max_count:
+            return False
+    return True
+
+
 def is_boolean(series: pd.Series) -> bool:
     """Heuristic which tells if a series contains only boolean values.
 
@@ -137,9 +288,28 @@ def is_boolean(series: pd.Series) -> bool:
     bool
         Boolean indicating if series is boolean.
     """
-    return not is_missing(series) and (
-        pd.api.types.is_bool_dtype(series) or set(series.unique()) <= {1, 0, pd.NA}
-    )
+    return not is_missing(series) and _is_boolean(series)
+
+
+def _is_boolean(series: pd.Series) -> bool:
+    """Implementation of `is_boolean`; assumes the series is not all-missing."""
+    import numpy as np
+
+    if series.dtype.kind == "b":
+        return True
+    arr = series.to_numpy(copy=False)
+    # Integer columns cannot hold missing values, so a single-pass min/max
+    # range check decides without hashing or materializing unique values.
+    if arr.dtype.kind in "iu":
+        return bool(arr.min() >= 0 and arr.max() <= 1)
+    if arr.dtype.kind == "f":
+        values = arr[~np.isnan(arr)]
+        return bool(((values == 0) | (values == 1)).all())
+    if arr.dtype.kind != "O":
+        return False
+    # A direct membership mask avoids deduplicating the column: no hash table
+    # is built and the comparisons run in NumPy's C loop.
+    return bool(np.isin(series.dropna().to_numpy(), (0, 1)).all())
 
 
 def is_date(series: pd.Series) -> bool:
@@ -155,15 +325,53 @@ def is_date(series: pd.Series) -> bool:
     bool
         Boolean indicating if series is of type datetime.
     """
+    import pandas as pd
+
     if isinstance(series.dtype, pd.PeriodDtype):
         return True
-    if is_missing(series) or is_numeric(series):
+    return not is_missing(series) and _is_date(series)
+
+
+def _is_date(series: pd.Series, sample_size: int = 32) -> bool:
+    """Implementation of `is_date`; assumes the series is not all-missing.
+
+    `sample_size` is the number of values examined by the cheap rejection checks
+    before any conversion is attempted on the full series.
+    """
+    import pandas as pd
+
+    # pylint cannot introspect the C extension behind pandas._libs.
+    from pandas._libs.tslibs.parsing import (  # pylint: disable=no-name-in-module
+        guess_datetime_format,
+    )
+
+    # Datetime-typed columns are dates by definition; anything that is neither
+    # datetime-typed nor string-like (numeric, bool, ...) cannot hold dates,
+    # so both cases resolve in O(1) from the dtype.
+    if isinstance(series.dtype, (pd.PeriodDtype, pd.DatetimeTZDtype)) or series.dtype.kind == "M":
+        return True
+    if series.dtype.kind not in "OUS":
         return False
-    contains_numerics = np.any(series.astype(str).str.isnumeric())
-    if contains_numerics:
+    sample = series.dropna().iloc[:sample_size]
+    # Purely numeric values are not considered dates; checking a small sample
+    # avoids casting the full series to string just to reject it.
+    if any(str(value).isnumeric() for value in sample):
         return False
     try:
-        converted_series = pd.to_datetime(series, errors="coerce", infer_datetime_format=True)
+        # Parsing with an explicit format dispatches to the C tokenizer, which is
+        # roughly an order of magnitude faster than per-element format inference.
+        fmt = guess_datetime_format(str(sample.iloc[0]))
+        if fmt is not None:
+            converted_sample = pd.to_datetime(sample, format=fmt, errors="coerce")
+            if converted_sample.notna().all():
+                converted_series = pd.to_datetime(series, format=fmt, errors="coerce")
+                if converted_series.notna().all():
+                    return True
+        # Mixed or unguessable formats fall back to per-element inference;
+        # the sample acts as a cheap reject before the full series is parsed.
+        return bool(
+            pd.to_datetime(sample, errors="coerce").notna().all()
+            and pd.to_datetime(series, errors="coerce").notna().all()
+        )
     except ValueError:
         return False
-    return converted_series.notna().all()
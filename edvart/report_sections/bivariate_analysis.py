@@ -275,13 +275,15 @@ class BivariateAnalysis(ReportSection):
         if self.verbosity != 0:
             return super().required_imports()
 
-        imports = {
-            "from edvart.report_sections.bivariate_analysis import BivariateAnalysis\n"
-            "bivariate_analysis = BivariateAnalysis.bivariate_analysis"
-        }
+        imports = dict.fromkeys(
+            [
+                "from edvart.report_sections.bivariate_analysis import BivariateAnalysis\n"
+                "bivariate_analysis = BivariateAnalysis.bivariate_analysis"
+            ]
+        )
         for subsec in self.subsections:
             if subsec.verbosity > 0:
-                imports.update(subsec.required_imports())
+                imports.update(dict.fromkeys(subsec.required_imports()))
 
         return list(imports)
 
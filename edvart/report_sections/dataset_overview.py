@@ -8,10 +8,18 @@ from IPython.display import Markdown, display
 
 from edvart.data_types import (
     DataType,
+    _infer_by_dtype,
+    _is_boolean,
+    _is_categorical,
+    _is_date,
+    _is_numeric,
+    _nunique_at_most,
     infer_data_type,
+    infer_data_types,
     is_boolean,
     is_categorical,
     is_date,
+    is_missing,
     is_numeric,
 )
 from edvart.pandas_formatting import hide_index, render_dictionary, series_to_frame
@@ -194,13 +202,15 @@ class Overview(ReportSection):
             e.g. ['import pandas as pd', 'import numpy as np']
         """
         if self.verbosity == 0:
-            imports = {
-                "from edvart.report_sections.dataset_overview import Overview\n"
-                "overview_analysis = Overview.overview_analysis"
-            }
+            imports = dict.fromkeys(
+                [
+                    "from edvart.report_sections.dataset_overview import Overview\n"
+                    "overview_analysis = Overview.overview_analysis"
+                ]
+            )
             for subsec in self.subsections:
                 if subsec.verbosity > 0:
-                    imports.update(subsec.required_imports())
+                    imports.update(dict.fromkeys(subsec.required_imports()))
 
             return list(imports)
         return super().required_imports()
@@ -394,12 +404,16 @@ class DataTypes(Section):
         """
         if columns is not None:
             df = df[columns]
-        dtypes = df.apply(
-            func=infer_data_type,
-            axis=0,
-            result_type="expand",
-            string_representation=True,
-        )
+        if df.columns.has_duplicates:
+            # A mapping keyed by column name would collapse duplicate labels.
+            dtypes = df.apply(
+                func=infer_data_type,
+                axis=0,
+                result_type="expand",
+                string_representation=True,
+            )
+        else:
+            dtypes = pd.Series(infer_data_types(df, string_representation=True))
 
         # Convert result to frame for viewing
         dtypes_frame = series_to_frame(
@@ -429,7 +443,9 @@ class DataTypes(Section):
             ]
         return base_imports + [
             "from enum import IntEnum",
+            "import sys",
             "import numpy as np",
+            "from pandas._libs.tslibs.parsing import guess_datetime_format",
             "from IPython.display import display",
         ]
 
@@ -457,16 +473,35 @@ class DataTypes(Section):
                 + 2 * "\n"
                 + get_code(DataType)
                 + 2 * "\n"
+                + "_DATATYPE_STR = "
+                "{data_type: sys.intern(data_type.name.lower()) for data_type in DataType}"
+                + 2 * "\n"
+                + get_code(is_missing)
+                + 2 * "\n"
                 + get_code(is_numeric)
                 + 2 * "\n"
+                + get_code(_is_numeric)
+                + 2 * "\n"
                 + get_code(is_categorical)
                 + 2 * "\n"
+                + get_code(_is_categorical)
+                + 2 * "\n"
+                + get_code(_nunique_at_most)
+                + 2 * "\n"
                 + get_code(is_boolean)
                 + 2 * "\n"
+                + get_code(_is_boolean)
+                + 2 * "\n"
                 + get_code(is_date)
                 + 2 * "\n"
+                + get_code(_is_date)
+                + 2 * "\n"
+                + get_code(_infer_by_dtype)
+                + 2 * "\n"
                 + get_code(infer_data_type)
                 + 2 * "\n"
+                + get_code(infer_data_types)
+                + 2 * "\n"
                 + get_code(DataTypes.data_types)
                 + 2 * "\n"
                 + default_call
@@ -189,13 +189,16 @@ class MultivariateAnalysis(ReportSection):
             e.g. ['import pandas as pd', 'import numpy as np']
         """
         if self.verbosity == 0:
-            imports = {
-                "from edvart.report_sections.multivariate_analysis import MultivariateAnalysis\n"
-                "multivariate_analysis = MultivariateAnalysis.multivariate_analysis"
-            }
+            imports = dict.fromkeys(
+                [
+                    "from edvart.report_sections.multivariate_analysis import "
+                    "MultivariateAnalysis\n"
+                    "multivariate_analysis = MultivariateAnalysis.multivariate_analysis"
+                ]
+            )
             for subsec in self.subsections:
                 if subsec.verbosity > 0:
-                    imports.update(subsec.required_imports())
+                    imports.update(dict.fromkeys(subsec.required_imports()))
 
             return list(imports)
         return super().required_imports()
@@ -1,9 +1,14 @@
-import uuid
+import itertools
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import pandas as pd
 
+# Source of section identifiers. Section uids are used as HTML anchors, which
+# only need to be unique within a single generated notebook, so a process-local
+# counter is sufficient and much cheaper than generating a UUID per section.
+_section_id_counter = itertools.count()
+
 
 class Section(ABC):
     """Base class for report sections and subsections.
@@ -41,12 +46,18 @@ class Section(ABC):
     * `show` renders the analysis in place in the calling notebook.
     """
 
+    # Reports hold hundreds of section instances; slots avoid the cost of
+    # a per-instance `__dict__`. Subclasses may still define arbitrary
+    # attributes, since they do not declare `__slots__` themselves.
+    __slots__ = ("verbosity", "columns", "_section_id", "_title_cache")
+
     def __init__(self, verbosity: int = 0, columns: Optional[List[str]] = None):
         if verbosity not in [0, 1, 2]:
             raise ValueError(f"Verbosity must be one of [0, 1, 2], not {verbosity}")
         self.verbosity = verbosity
         self.columns = columns
-        self._section_id: str = str(uuid.uuid4())
+        self._section_id: str = f"section-{next(_section_id_counter):x}"
+        self._title_cache: Dict[int, str] = {}
 
     @property
     @abstractmethod
@@ -88,9 +99,14 @@ class Section(ABC):
         str
             Title of the section in markdown format.
         """
-        title = f"{'#' * section_level} {self.name}<a id='{self.uid}'>"
-        if section_level == 1:
-            title += "\n---"
+        # Table of contents generation requests the same titles repeatedly;
+        # the formatted string is cached per section level.
+        title = self._title_cache.get(section_level)
+        if title is None:
+            title = f"{'#' * section_level} {self.name}<a id='{self.uid}'>"
+            if section_level == 1:
+                title += "\n---"
+            self._title_cache[section_level] = title
         return title
 
     @abstractmethod
@@ -104,6 +120,14 @@ class Section(ABC):
             e.g. ['import pandas as pd', 'import numpy as np']
         """
 
+    def _iter_imports(self) -> Iterator[str]:
+        """Iterates over the imports required by this section.
+
+        Sections containing subsections override this method to yield from
+        their subsections directly, without materializing intermediate lists.
+        """
+        yield from self.required_imports()
+
     @abstractmethod
     def add_cells(self, cells: List[Dict[str, Any]]) -> None:
         """Adds cells to the list of cells.
@@ -146,6 +170,8 @@ class ReportSection(Section):
         all columns are used by default
     """
 
+    __slots__ = ("subsections", "_cached_imports")
+
     def __init__(
         self,
         subsections: List[Section],
@@ -154,21 +180,36 @@ class ReportSection(Section):
     ):
         super().__init__(verbosity, columns)
         self.subsections = subsections
+        self._cached_imports: Optional[List[str]] = None
 
     def required_imports(self) -> List[str]:
         """Returns a list of imports to be put at the top of a generated notebook.
 
+        The imports are gathered from the subsections once and cached, since
+        subsections are supplied at construction time and notebook generation
+        may ask for the imports repeatedly. The list is deduplicated while
+        preserving the order in which the imports are first encountered.
+
         Returns
         -------
         List[str]
             List of import strings to be added at the top of the generated notebook,
             e.g. ['import pandas as pd', 'import numpy as np'].
         """
-        imports_set = set()
-        for subsec in self.subsections:
-            imports_set.update(subsec.required_imports())
+        if self._cached_imports is None:
+            self._cached_imports = list(dict.fromkeys(self._iter_imports()))
+
+        return self._cached_imports
 
-        return list(imports_set)
+    def _iter_imports(self) -> Iterator[str]:
+        """Iterates over the imports required by the subsections of this section.
+
+        Goes through `required_imports` rather than `_iter_imports` so that
+        subsections which override `required_imports` (e.g. sections that export
+        a single function call at verbosity 0) are respected.
+        """
+        for subsec in self.subsections:
+            yield from subsec.required_imports()
 
     def add_cells(self, cells: List[Dict[str, Any]]) -> None:
         """Adds cells to the list of cells.
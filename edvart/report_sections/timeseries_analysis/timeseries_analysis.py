@@ -305,13 +305,15 @@ class TimeseriesAnalysis(ReportSection):
             e.g. ["import pandas as pd", "import numpy as np"]
         """
         if self.verbosity == 0:
-            imports = {
-                "from edvart.report_sections.timeseries_analysis import TimeseriesAnalysis\n"
-                "timeseries_analysis = TimeseriesAnalysis.timeseries_analysis"
-            }
+            imports = dict.fromkeys(
+                [
+                    "from edvart.report_sections.timeseries_analysis import TimeseriesAnalysis\n"
+                    "timeseries_analysis = TimeseriesAnalysis.timeseries_analysis"
+                ]
+            )
             for sub in self.subsections:
                 if sub.verbosity > 0:
-                    imports.update(sub.required_imports())
+                    imports.update(dict.fromkeys(sub.required_imports()))
 
             return list(imports)
         return super().required_imports()
@@ -348,7 +348,7 @@ def test_imports_verbosity_1():
 
     exported_imports = bivariate_section.required_imports()
     expected_imports = list(
-        set().union(*[s.required_imports() for s in bivariate_section.subsections])
+        dict.fromkeys(imp for s in bivariate_section.subsections for imp in s.required_imports())
     )
 
     assert isinstance(exported_imports, list)
@@ -362,7 +362,7 @@ def test_imports_verbosity_2():
 
     exported_imports = bivariate_section.required_imports()
     expected_imports = list(
-        set().union(*[s.required_imports() for s in bivariate_section.subsections])
+        dict.fromkeys(imp for s in bivariate_section.subsections for imp in s.required_imports())
     )
 
     assert isinstance(exported_imports, list)
@@ -386,16 +386,18 @@ def test_imports_verbosity_0_different_subsection_verbosities():
 
     exported_imports = bivariate_section.required_imports()
 
-    expected_imports = {
-        "from edvart.report_sections.bivariate_analysis import BivariateAnalysis\n"
-        "bivariate_analysis = BivariateAnalysis.bivariate_analysis"
-    }
+    expected_imports = dict.fromkeys(
+        [
+            "from edvart.report_sections.bivariate_analysis import BivariateAnalysis\n"
+            "bivariate_analysis = BivariateAnalysis.bivariate_analysis"
+        ]
+    )
     for s in bivariate_section.subsections:
         if s.verbosity > 0:
-            expected_imports.update(s.required_imports())
+            expected_imports.update(dict.fromkeys(s.required_imports()))
 
     assert isinstance(exported_imports, list)
-    assert set(exported_imports) == set(expected_imports)
+    assert exported_imports == list(expected_imports)
 
 
 def test_show():
@@ -21,11 +21,40 @@ def test_inference():
         data_types.infer_data_type(pd.Series([True, False, False, True, True]))
         == data_types.DataType.BOOLEAN
     ), "Should be boolean type"
-    assert data_types.infer_data_type(
-        pd.Series([None, None, np.nan, float("nan")]) == data_types.DataType.MISSING
+    assert (
+        data_types.infer_data_type(pd.Series([None, None, np.nan, float("nan")]))
+        == data_types.DataType.MISSING
     ), "Should be missing"
 
 
+def test_batch_inference():
+    df = pd.DataFrame(
+        {
+            "numeric": [0.12, 3565.3, 234.0],
+            "date": ["2014-01-01", "2014-01-02", "2014-12-03 14:05:02"],
+            "categorical": ["A", "B", "A"],
+            "boolean": [True, False, True],
+            "missing": [None, np.nan, float("nan")],
+        }
+    )
+    expected = {
+        "numeric": data_types.DataType.NUMERIC,
+        "date": data_types.DataType.DATE,
+        "categorical": data_types.DataType.CATEGORICAL,
+        "boolean": data_types.DataType.BOOLEAN,
+        "missing": data_types.DataType.MISSING,
+    }
+    assert data_types.infer_data_types(df) == expected, "Inferred types should match"
+    assert data_types.infer_data_types(df, string_representation=True) == {
+        column: str(data_type) for column, data_type in expected.items()
+    }, "Inferred type names should match"
+
+    df_duplicate_columns = pd.DataFrame([[1.5, "A"], [2.5, "B"]], columns=["col", "col"])
+    assert data_types.infer_data_types(df_duplicate_columns) == {
+        "col": data_types.DataType.CATEGORICAL
+    }, "Duplicate column labels should collapse to the last occurrence"
+
+
 def test_missing_series():
     assert data_types.is_missing(pd.Series([None, None, np.nan, float("nan")])), "Should be missing"
     assert data_types.is_missing(pd.Series([pd.NA])), "Should be missing"
@@ -54,6 +83,9 @@ def test_categorical_series():
     assert data_types.is_categorical(
         pd.Series([1, 2, 3, 4, 4, 4, 1, 1, 1, 2, 2, 3, 4])
     ), "Should be categorical"
+    assert data_types.is_categorical(
+        pd.Series(list(range(1, 11)) + [pd.NA], dtype="Int64")
+    ), "Missing values should not count towards the unique value threshold"
     assert not data_types.is_categorical(
         pd.Series([1, 2, 31, 4, 52, 6, 87, 87.7, 9, 1, 3, 4, 1, 10, 123123, 9876, 1.2, 6.8])
     ), "Should not be categorical"
@@ -370,7 +370,7 @@ def test_imports_verbosity_1():
 
     exported_imports = multivariate_section.required_imports()
     expected_imports = list(
-        set().union(*[s.required_imports() for s in multivariate_section.subsections])
+        dict.fromkeys(imp for s in multivariate_section.subsections for imp in s.required_imports())
     )
 
     assert isinstance(exported_imports, list)
@@ -384,7 +384,7 @@ def test_imports_verbosity_2():
 
     exported_imports = multivariate_section.required_imports()
     expected_imports = list(
-        set().union(*[s.required_imports() for s in multivariate_section.subsections])
+        dict.fromkeys(imp for s in multivariate_section.subsections for imp in s.required_imports())
     )
 
     assert isinstance(exported_imports, list)
@@ -412,16 +412,18 @@ def test_imports_verbosity_0_different_subsection_verbosities():
 
     exported_imports = multivariate_section.required_imports()
 
-    expected_imports = {
-        "from edvart.report_sections.multivariate_analysis import MultivariateAnalysis\n"
-        "multivariate_analysis = MultivariateAnalysis.multivariate_analysis"
-    }
+    expected_imports = dict.fromkeys(
+        [
+            "from edvart.report_sections.multivariate_analysis import MultivariateAnalysis\n"
+            "multivariate_analysis = MultivariateAnalysis.multivariate_analysis"
+        ]
+    )
     for s in multivariate_section.subsections:
         if s.verbosity > 0:
-            expected_imports.update(s.required_imports())
+            expected_imports.update(dict.fromkeys(s.required_imports()))
 
     assert isinstance(exported_imports, list)
-    assert set(exported_imports) == set(expected_imports)
+    assert exported_imports == list(expected_imports)
 
 
 def test_show():
@@ -6,10 +6,18 @@ import pytest
 
 from edvart.data_types import (
     DataType,
+    _infer_by_dtype,
+    _is_boolean,
+    _is_categorical,
+    _is_date,
+    _is_numeric,
+    _nunique_at_most,
     infer_data_type,
+    infer_data_types,
     is_boolean,
     is_categorical,
     is_date,
+    is_missing,
     is_numeric,
 )
 from edvart.pandas_formatting import render_dictionary, series_to_frame
@@ -222,11 +230,21 @@ def test_code_export_verbosity_2():
             (
                 get_code(series_to_frame),
                 get_code(DataType),
+                "_DATATYPE_STR = "
+                "{data_type: sys.intern(data_type.name.lower()) for data_type in DataType}",
+                get_code(is_missing),
                 get_code(is_numeric),
+                get_code(_is_numeric),
                 get_code(is_categorical),
+                get_code(_is_categorical),
+                get_code(_nunique_at_most),
                 get_code(is_boolean),
+                get_code(_is_boolean),
                 get_code(is_date),
+                get_code(_is_date),
+                get_code(_infer_by_dtype),
                 get_code(infer_data_type),
+                get_code(infer_data_types),
                 get_code(dataset_overview.DataTypes.data_types),
                 "data_types(df=df)",
             )
@@ -319,7 +337,7 @@ def test_imports_verbosity_1():
 
     exported_imports = multivariate_section.required_imports()
     expected_imports = list(
-        set().union(*[s.required_imports() for s in multivariate_section.subsections])
+        dict.fromkeys(imp for s in multivariate_section.subsections for imp in s.required_imports())
     )
 
     assert isinstance(exported_imports, list)
@@ -333,7 +351,7 @@ def test_imports_verbosity_2():
 
     exported_imports = multivariate_section.required_imports()
     expected_imports = list(
-        set().union(*[s.required_imports() for s in multivariate_section.subsections])
+        dict.fromkeys(imp for s in multivariate_section.subsections for imp in s.required_imports())
     )
 
     assert isinstance(exported_imports, list)
@@ -351,16 +369,18 @@ def test_imports_verbosity_0_different_subsection_verbosities():
 
     exported_imports = overview_section.required_imports()
 
-    expected_imports = {
-        "from edvart.report_sections.dataset_overview import Overview\n"
-        "overview_analysis = Overview.overview_analysis"
-    }
+    expected_imports = dict.fromkeys(
+        [
+            "from edvart.report_sections.dataset_overview import Overview\n"
+            "overview_analysis = Overview.overview_analysis"
+        ]
+    )
     for s in overview_section.subsections:
         if s.verbosity > 0:
-            expected_imports.update(s.required_imports())
+            expected_imports.update(dict.fromkeys(s.required_imports()))
 
     assert isinstance(exported_imports, list)
-    assert set(exported_imports) == set(expected_imports)
+    assert exported_imports == list(expected_imports)
 
 
 def test_show():
@@ -417,7 +417,9 @@ def test_imports_verbosity_1():
     ts_section = TimeseriesAnalysis(verbosity=1)
 
     exported_imports = ts_section.required_imports()
-    expected_imports = list(set().union(*[s.required_imports() for s in ts_section.subsections]))
+    expected_imports = list(
+        dict.fromkeys(imp for s in ts_section.subsections for imp in s.required_imports())
+    )
 
     assert isinstance(exported_imports, list)
     assert len(expected_imports) == len(exported_imports)
@@ -429,7 +431,9 @@ def test_imports_verbosity_2():
     ts_section = TimeseriesAnalysis(verbosity=2)
 
     exported_imports = ts_section.required_imports()
-    expected_imports = list(set().union(*[s.required_imports() for s in ts_section.subsections]))
+    expected_imports = list(
+        dict.fromkeys(imp for s in ts_section.subsections for imp in s.required_imports())
+    )
 
     assert isinstance(exported_imports, list)
     assert len(expected_imports) == len(exported_imports)
@@ -456,16 +460,18 @@ def test_imports_verbosity_0_different_subsection_verbosities():
 
     exported_imports = ts_section.required_imports()
 
-    expected_imports = {
-        "from edvart.report_sections.timeseries_analysis import TimeseriesAnalysis\n"
-        "timeseries_analysis = TimeseriesAnalysis.timeseries_analysis"
-    }
+    expected_imports = dict.fromkeys(
+        [
+            "from edvart.report_sections.timeseries_analysis import TimeseriesAnalysis\n"
+            "timeseries_analysis = TimeseriesAnalysis.timeseries_analysis"
+        ]
+    )
     for s in ts_section.subsections:
         if s.verbosity > 0:
-            expected_imports.update(s.required_imports())
+            expected_imports.update(dict.fromkeys(s.required_imports()))
 
     assert isinstance(exported_imports, list)
-    assert set(exported_imports) == set(expected_imports)
+    assert exported_imports == list(expected_imports)
 
 
 def test_show():